@@ -0,0 +1,85 @@
+"""
+Cold start check for the package facade
+
+Runs each import in fresh interpreters and fails when the fastest run takes longer than the budget. The bare
+import udemdatastructures must also load no submodule. The first access to a class loads its submodule, so
+from udemdatastructures import <name> is timed as well, for ArrayQueue, ArrayStack, BinarySearchTree and the names
+given with --names.
+
+Every class with type parameters (class ArrayQueue[T]) makes Python import typing, which takes several
+milliseconds on its own. That cost belongs to the interpreter rather than to the package, so typing is imported
+before the clock starts and its time is reported separately. Run it from the repository root:
+
+    python benchmarks/import_time.py [--budget-ms 10] [--runs 10] [--names Dispatcher TimerWheel]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SOURCE = Path(__file__).resolve().parent.parent / "src"
+
+DEFAULT_NAMES = ["ArrayQueue", "ArrayStack", "BinarySearchTree"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import typing
+typing_elapsed = time.perf_counter() - start
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in sys.modules if name.startswith("udemdatastructures."))
+print(json.dumps({"elapsed": elapsed, "typing": typing_elapsed, "loaded": loaded}))
+"""
+
+
+def measure(statement: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SOURCE), env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-c", _PROBE, statement], env=env, capture_output=True, text=True,
+                            check=True)
+    return json.loads(result.stdout)
+
+
+def fastest(statement: str, runs: int) -> dict:
+    # The first run writes the bytecode cache, as an installed package would already have it
+    measure(statement)
+    samples = [measure(statement) for _ in range(runs)]
+    return {
+        "elapsed": min(sample["elapsed"] for sample in samples) * 1000,
+        "typing": min(sample["typing"] for sample in samples) * 1000,
+        "loaded": sorted({name for sample in samples for name in sample["loaded"]}),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=10.0,
+                        help="maximum time of each import in milliseconds, typing excluded")
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh interpreters per import")
+    parser.add_argument("--names", nargs="*", default=[], help="more names to import from the package")
+    args = parser.parse_args()
+
+    statements = ["import udemdatastructures"]
+    statements += [f"from udemdatastructures import {name}" for name in DEFAULT_NAMES + args.names]
+    failed = False
+    typing_time = None
+    for statement in statements:
+        result = fastest(statement, args.runs)
+        typing_time = result["typing"] if typing_time is None else min(typing_time, result["typing"])
+        over = result["elapsed"] > args.budget_ms
+        print(f"{statement:50} {result['elapsed']:7.2f} ms{'  FAIL: over budget' if over else ''}")
+        failed |= over
+        if statement == "import udemdatastructures" and result["loaded"]:
+            print(f"FAIL: the import loaded submodules: {', '.join(result['loaded'])}")
+            failed = True
+    print(f"budget {args.budget_ms:.2f} ms per import, plus {typing_time:.2f} ms for import typing")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Iteration and memory benchmark of the linked list classes
+
+Builds each list with the same items and reports the time of a full iteration and the memory_footprint of the
+list. Run it from the repository root:
+
+    python benchmarks/linked_lists.py [--items 100000]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from udemdatastructures.linked_lists import (DoubleEndedLinkedList, DoublyLinkedList,  # noqa: E402
+                                             SinglyLinkedList, UnrolledLinkedList)
+
+
+def build(factory, items: int):
+    linked_list = factory()
+    if type(linked_list) in (SinglyLinkedList, DoublyLinkedList):
+        # append walks the whole list on these classes, so the items are inserted at the front in reverse
+        for value in reversed(range(items)):
+            linked_list.insert(value)
+    else:
+        for value in range(items):
+            linked_list.append(value)
+    return linked_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    factories = [
+        ("SinglyLinkedList", SinglyLinkedList),
+        ("DoubleEndedLinkedList", DoubleEndedLinkedList),
+        ("DoublyLinkedList", DoublyLinkedList),
+        ("UnrolledLinkedList(16)", lambda: UnrolledLinkedList(16)),
+        ("UnrolledLinkedList(64)", lambda: UnrolledLinkedList(64)),
+    ]
+    print(f"{args.items} int items")
+    print(f"{'class':24} {'iteration ms':>12} {'total bytes':>12} {'overhead/item':>14}")
+    for name, factory in factories:
+        linked_list = build(factory, args.items)
+        assert list(linked_list) == list(range(args.items))
+        iteration = min(timeit.repeat(lambda: sum(1 for _ in linked_list), number=1, repeat=5))
+        memory = linked_list.memory_footprint()
+        print(f"{name:24} {iteration * 1000:12.2f} {memory.total_bytes:12} {memory.per_element_overhead:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Consistency check of memory_footprint for nested containers
+
+Stores each container inside an ArrayStack and fails when the element bytes the stack reports differ from the
+total_bytes the inner container reports for itself, which happens when nested containers are counted twice.
+It also fails when an element referenced several times is counted more than once. Run it from the repository root:
+
+    python benchmarks/memory_footprint.py
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from udemdatastructures.linked_lists import SinglyLinkedList, UnrolledLinkedList  # noqa: E402
+from udemdatastructures.queue import ArrayQueue  # noqa: E402
+from udemdatastructures.stack import ArrayStack  # noqa: E402
+from udemdatastructures.trees import BinarySearchTree  # noqa: E402
+
+
+def filled(factory, add: str, items: int = 20):
+    container = factory()
+    for index in range(items):
+        getattr(container, add)(f"item {index:04}")
+    return container
+
+
+def stack_of(item) -> ArrayStack:
+    stack = ArrayStack()
+    stack.push(item)
+    return stack
+
+
+def main() -> int:
+    cases = [
+        ("ArrayStack", lambda: filled(ArrayStack, "push")),
+        ("ArrayQueue", lambda: filled(ArrayQueue, "enqueue")),
+        ("SinglyLinkedList", lambda: filled(SinglyLinkedList, "insert")),
+        ("UnrolledLinkedList", lambda: filled(UnrolledLinkedList, "append")),
+        ("BinarySearchTree", lambda: filled(BinarySearchTree, "insert")),
+        ("ArrayStack of ArrayStack", lambda: stack_of(filled(ArrayStack, "push"))),
+    ]
+    failed = False
+    for name, build in cases:
+        inner = build()
+        outer = stack_of(inner)
+        expected = inner.memory_footprint().total_bytes
+        reported = outer.memory_footprint().element_bytes
+        status = "ok" if reported == expected else "FAIL"
+        print(f"{name:26} nested in ArrayStack: element_bytes {reported:6}, own total_bytes {expected:6}  {status}")
+        failed |= reported != expected
+
+    shared = "x" * 10_000
+    repeated = ArrayStack()
+    for _ in range(100):
+        repeated.push(shared)
+    reported = repeated.memory_footprint().element_bytes
+    status = "ok" if reported == sys.getsizeof(shared) else "FAIL"
+    print(f"{'one string pushed 100 times':26} element_bytes {reported:6}, string {sys.getsizeof(shared):6}  {status}")
+    failed |= reported != sys.getsizeof(shared)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Memory overhead of PersistentBinarySearchTree snapshots
+
+Builds a BinarySearchTree and a PersistentBinarySearchTree with the same random keys and compares their
+memory_footprint. Then it applies a number of updates to the persistent tree while keeping the snapshot taken
+after each one, and measures with tracemalloc the memory those versions keep alive. Run it from the repository
+root:
+
+    python benchmarks/persistent_tree.py [--items 100000] [--updates 1000]
+"""
+import argparse
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from udemdatastructures.trees import BinarySearchTree, PersistentBinarySearchTree  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=1_000)
+    args = parser.parse_args()
+    generator = random.Random(0)
+    keys = generator.sample(range(10 * args.items), args.items)
+
+    plain = BinarySearchTree()
+    persistent = PersistentBinarySearchTree()
+    for key in keys:
+        plain.insert(key)
+        persistent.insert(key)
+    plain_bytes = plain.memory_footprint().total_bytes
+    persistent_bytes = persistent.memory_footprint().total_bytes
+    print(f"{args.items} keys, height {plain.height}")
+    print(f"BinarySearchTree            {plain_bytes:12} bytes")
+    print(f"PersistentBinarySearchTree  {persistent_bytes:12} bytes (one version)")
+
+    updates = [generator.randrange(10 * args.items) for _ in range(args.updates)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    snapshots = []
+    for position, key in enumerate(updates):
+        if position % 2:
+            persistent.delete(key)
+        else:
+            persistent.insert(key)
+        snapshots.append(persistent.snapshot())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"{args.updates} updates with every snapshot kept: {retained} bytes, "
+          f"{retained / args.updates:.0f} bytes per version "
+          f"({retained / args.updates / (persistent_bytes / args.items):.1f} items' worth), "
+          f"against {persistent_bytes} bytes for a full copy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Round-robin benchmark: CircularLinkedList cursor against collections.deque
+
+Times handing out turns across a ring of agents with CircularLinkedList.next() and with deque[0] plus
+deque.rotate(-1), rotating by large steps, and logging agents off at the cursor. Run it from the repository root:
+
+    python benchmarks/round_robin.py [--agents 100] [--turns 200000]
+"""
+import argparse
+import sys
+import timeit
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from udemdatastructures.linked_lists import CircularLinkedList  # noqa: E402
+from udemdatastructures.scheduler import WeightedRoundRobin  # noqa: E402
+
+
+def ring(agents: int) -> CircularLinkedList[int]:
+    circular = CircularLinkedList()
+    for agent in range(agents):
+        circular.append(agent)
+    return circular
+
+
+def best_of(statement, setup, repeat: int = 5) -> float:
+    return min(timeit.repeat(statement, setup=setup, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--turns", type=int, default=200_000)
+    args = parser.parse_args()
+    agents, turns = args.agents, args.turns
+    state = {}
+
+    def setup():
+        state["ring"] = ring(agents)
+        state["deque"] = deque(range(agents))
+        state["wrr"] = WeightedRoundRobin()
+        for agent in range(agents):
+            state["wrr"].add(agent)
+
+    def ring_turns():
+        take = state["ring"].next
+        for _ in range(turns):
+            take()
+
+    def deque_turns():
+        agents_deque = state["deque"]
+        for _ in range(turns):
+            agents_deque[0]
+            agents_deque.rotate(-1)
+
+    def wrr_turns():
+        take = state["wrr"].next
+        for _ in range(turns):
+            take()
+
+    def ring_rotate():
+        for step in range(1_000):
+            state["ring"].rotate(step * 7919)
+
+    def deque_rotate():
+        for step in range(1_000):
+            state["deque"].rotate(-step * 7919)
+
+    def ring_log_off():
+        circular = state["ring"]
+        while not circular.is_empty():
+            circular.next()
+            circular.remove_current()
+
+    def deque_log_off():
+        agents_deque = state["deque"]
+        while agents_deque:
+            agents_deque.rotate(-1)
+            agents_deque.popleft()
+
+    print(f"{agents} agents")
+    rows = [
+        (f"{turns} turns", ring_turns, deque_turns),
+        ("1000 rotations by large steps", ring_rotate, deque_rotate),
+        ("log off every agent at the cursor", ring_log_off, deque_log_off),
+    ]
+    for name, ring_case, deque_case in rows:
+        ring_time = best_of(ring_case, setup)
+        deque_time = best_of(deque_case, setup)
+        print(f"{name:36} CircularLinkedList {ring_time * 1000:9.2f} ms   deque {deque_time * 1000:9.2f} ms"
+              f"   ratio {ring_time / deque_time:6.1f}x")
+    print(f"{f'{turns} turns':36} WeightedRoundRobin {best_of(wrr_turns, setup) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,11 @@
+import heapq
+import sys
+from collections.abc import Callable, Iterable, Iterator
+
+from .memory import MemoryFootprint, footprint, list_capacity, shallow_size
+from .queue import ArrayQueue
+
+
 class PriorityQueue:
     def __init__(self):
         self.items = []
@@ -19,3 +27,335 @@ class PriorityQueue:
 
     def size(self):
         return len(self.items)
+
+    def memory_footprint(self) -> MemoryFootprint:
+        # Each element is stored in an (item, priority) tuple
+        entries = sum(sys.getsizeof(entry) + sys.getsizeof(entry[1]) for entry in self.items)
+        structure = shallow_size(self) + sys.getsizeof(self.items) + entries
+        slack = list_capacity(self.items) - len(self.items)
+        return footprint(structure, (entry[0] for entry in self.items), slack)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+
+class BucketPriorityQueue:
+    """
+    Priority queue for small integer priorities
+
+    Keeps one FIFO ArrayQueue per priority level (lane) and a bitmap of the non-empty lanes, so enqueue and
+    dequeue are O(1). As in PriorityQueue, a lower number means a higher priority.
+
+    With weights, dequeue drains the lanes in weighted-fair rounds: in each round lane p gives up to weights[p]
+    items, highest priority first, so the low priorities are not starved.
+    """
+    def __init__(self, levels: int, weights: list[int] | None = None):
+        if levels < 1:
+            raise ValueError("There must be at least one priority level")
+        if weights is not None and (len(weights) != levels or any(weight < 1 for weight in weights)):
+            raise ValueError("There must be one positive weight per priority level")
+        self.lanes: list[ArrayQueue] = [ArrayQueue() for _ in range(levels)]
+        self.weights: list[int] | None = weights
+        self._credits: list[int] = list(weights) if weights is not None else []
+        self._bitmap: int = 0  # Bit p is set when lane p is not empty
+        self._credit_bitmap: int = (1 << levels) - 1  # Bit p is set while lane p has credit left in this round
+        self._size: int = 0
+
+    def is_empty(self):
+        return self._size == 0
+
+    def enqueue(self, item, priority: int):
+        if not 0 <= priority < len(self.lanes):
+            raise ValueError("Priority out of range")
+        self.lanes[priority].enqueue(item)
+        self._bitmap |= 1 << priority
+        self._size += 1
+
+    def dequeue(self):
+        if not self.is_empty():
+            lane = self._next_lane()
+            item = self.lanes[lane].dequeue()
+            if self.lanes[lane].is_empty():
+                self._bitmap &= ~(1 << lane)
+            if self.weights is not None:
+                self._credits[lane] -= 1
+                if self._credits[lane] == 0:
+                    self._credit_bitmap &= ~(1 << lane)
+            self._size -= 1
+            return item
+
+    def peek(self):
+        if not self.is_empty():
+            return self.lanes[self._next_lane()].first()
+
+    def _next_lane(self) -> int:
+        if self.weights is None:
+            return self._lowest_bit(self._bitmap)
+        ready = self._bitmap & self._credit_bitmap
+        if ready == 0:
+            # Every non-empty lane used up its share, a new round starts
+            self._credits = list(self.weights)
+            self._credit_bitmap = (1 << len(self.lanes)) - 1
+            ready = self._bitmap
+        return self._lowest_bit(ready)
+
+    @staticmethod
+    def _lowest_bit(bitmap: int) -> int:
+        return (bitmap & -bitmap).bit_length() - 1
+
+    def lane_size(self, priority: int) -> int:
+        return len(self.lanes[priority])
+
+    def lane_sizes(self) -> list[int]:
+        return [len(lane) for lane in self.lanes]
+
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def memory_footprint(self) -> MemoryFootprint:
+        lanes = [lane.memory_footprint() for lane in self.lanes]
+        structure = shallow_size(self) + sys.getsizeof(self.lanes) + sys.getsizeof(self._credits)
+        structure += sum(lane.overhead_bytes for lane in lanes)
+        # The elements are measured together so that objects shared between lanes are counted once
+        elements = (item for lane in self.lanes for item in lane._items())
+        return footprint(structure, elements, sum(lane.slack_slots for lane in lanes))
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+
+class IndexedPriorityQueue:
+    """
+    Binary heap priority queue that keeps the heap position of every item
+
+    The items themselves are the handles, so they must be hashable and unique in the queue. Besides enqueue and
+    dequeue, an item can be looked up in O(1) and re-prioritized or removed in O(log n), which also makes it
+    suitable for decrease-key in Dijkstra-style algorithms. As in PriorityQueue, a lower number means a higher
+    priority and items with equal priority leave in arrival order.
+    """
+    def __init__(self):
+        # [priority, arrival order, item] entries. The arrival order is unique, so entries are compared as a whole
+        # and the item is never reached
+        self._heap: list[list] = []
+        self._positions: dict = {}
+        self._order: int = 0
+
+    def is_empty(self):
+        return len(self._heap) == 0
+
+    def enqueue(self, item, priority):
+        if item in self._positions:
+            raise ValueError("Item already in queue")
+        self._heap.append([priority, self._order, item])
+        self._order += 1
+        self._positions[item] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def dequeue(self):
+        if not self.is_empty():
+            item = self._heap[0][2]
+            self._remove_at(0)
+            return item
+
+    def peek(self):
+        if not self.is_empty():
+            return self._heap[0][2]
+
+    def contains(self, item) -> bool:
+        return item in self._positions
+
+    def __contains__(self, item) -> bool:
+        return item in self._positions
+
+    def priority(self, item):
+        return self._heap[self._position(item)][0]
+
+    def update_priority(self, item, priority):
+        """
+        Changes the priority of a queued item. The item keeps its arrival order among equal priorities
+        """
+        position = self._position(item)
+        entry = self._heap[position]
+        old_priority, entry[0] = entry[0], priority
+        if priority < old_priority:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def remove(self, item):
+        self._remove_at(self._position(item))
+
+    def _position(self, item) -> int:
+        if item not in self._positions:
+            raise KeyError("Item not in queue")
+        return self._positions[item]
+
+    def _remove_at(self, position: int):
+        last = self._heap.pop()
+        del self._positions[last[2]]
+        if position == len(self._heap):
+            return
+        removed = self._heap[position]
+        del self._positions[removed[2]]
+        self._heap[position] = last
+        self._positions[last[2]] = position
+        if last < removed:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def _sift_up(self, position: int):
+        heap = self._heap
+        positions = self._positions
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if not entry < heap[parent]:
+                break
+            heap[position] = heap[parent]
+            positions[heap[position][2]] = position
+            position = parent
+        heap[position] = entry
+        positions[entry[2]] = position
+
+    def _sift_down(self, position: int):
+        heap = self._heap
+        positions = self._positions
+        entry = heap[position]
+        size = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            heap[position] = heap[child]
+            positions[heap[position][2]] = position
+            position = child
+        heap[position] = entry
+        positions[entry[2]] = position
+
+    def size(self):
+        return len(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def memory_footprint(self) -> MemoryFootprint:
+        # Each element is stored in a [priority, arrival order, item] list and indexed in the positions dict
+        entries = sum(sys.getsizeof(entry) + sys.getsizeof(entry[0]) + sys.getsizeof(entry[1])
+                      for entry in self._heap)
+        structure = shallow_size(self) + sys.getsizeof(self._heap) + sys.getsizeof(self._positions) + entries
+        slack = list_capacity(self._heap) - len(self._heap)
+        return footprint(structure, (entry[2] for entry in self._heap), slack)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+
+class _Reversed:
+    """
+    Wraps a key so that it compares in the opposite order
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.value == other.value
+
+
+class TopK:
+    """
+    Keeps the k best items of a stream
+
+    Backed by a heap of at most k items whose root is the worst item kept, so a new item either is discarded or
+    replaces the root in O(log k). A stream of n items is processed in O(n log k) time and O(k) memory. Among
+    items with equal keys the earliest ones are kept.
+
+    Attributes:
+    k: int
+        The number of items to keep
+    key: Callable[[Any], Any] | None
+        The function to extract the key from the item. Default is the item itself
+    largest: bool
+        If True the items with the largest keys are kept, otherwise the ones with the smallest keys
+    """
+    def __init__(self, k: int, key: Callable | None = None, largest: bool = True):
+        if k < 1:
+            raise ValueError("k must be positive")
+        self.k: int = k
+        self.key: Callable | None = key
+        self.largest: bool = largest
+        self._heap: list[tuple] = []  # (rank, -arrival order, item) entries
+        self._order: int = 0
+
+    def push(self, item):
+        key = item if self.key is None else self.key(item)
+        # Later arrivals rank lower, so on ties the earliest items are kept
+        entry = (key if self.largest else _Reversed(key), -self._order, item)
+        self._order += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+
+    def push_many(self, items: Iterable):
+        for item in items:
+            self.push(item)
+
+    def peek(self):
+        """
+        Returns the worst item kept, which a new item has to beat to get in
+        """
+        if not self.is_empty():
+            return self._heap[0][2]
+
+    def items(self) -> list:
+        """
+        Returns the items kept, best first
+        """
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+    def is_empty(self):
+        return len(self._heap) == 0
+
+    def size(self):
+        return len(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items())
+
+    def memory_footprint(self) -> MemoryFootprint:
+        # Each element is stored in a (rank, -arrival order, item) tuple
+        entries = sum(sys.getsizeof(entry) + sys.getsizeof(entry[0]) + sys.getsizeof(entry[1])
+                      for entry in self._heap)
+        structure = shallow_size(self) + sys.getsizeof(self._heap) + entries
+        slack = list_capacity(self._heap) - len(self._heap)
+        return footprint(structure, (entry[2] for entry in self._heap), slack)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+
+def merge(*iterables: Iterable, key: Callable | None = None, reverse: bool = False) -> Iterator:
+    """
+    Lazily merges sorted iterables into a single sorted iterator, holding one item per iterable at a time
+
+    :param iterables: The iterables, each sorted by key (in descending order if reverse is True)
+    :param key: The function to extract the key from the items. Default is the item itself
+    :param reverse: True if the iterables are sorted in descending order
+    """
+    return heapq.merge(*iterables, key=key, reverse=reverse)
@@ -1,4 +1,4 @@
-from src.udemdatastructures.queue import ArrayQueue
+from .queue import ArrayQueue
 
 class CallCenter:
     def __init__(self):
@@ -15,13 +15,15 @@ class CallCenter:
             numero = self.cola_llamadas.dequeue()
             print(f"Atendiendo llamada del número {numero}")
 
-llamadas = CallCenter()
 
-llamadas.recibir_llamada("1")
-llamadas.recibir_llamada("2")
-llamadas.recibir_llamada("3")
+if __name__ == "__main__":
+    llamadas = CallCenter()
 
-llamadas.atender_llamada()
-llamadas.atender_llamada()
-llamadas.atender_llamada()
-llamadas.atender_llamada()
\ No newline at end of file
+    llamadas.recibir_llamada("1")
+    llamadas.recibir_llamada("2")
+    llamadas.recibir_llamada("3")
+
+    llamadas.atender_llamada()
+    llamadas.atender_llamada()
+    llamadas.atender_llamada()
+    llamadas.atender_llamada()
\ No newline at end of file
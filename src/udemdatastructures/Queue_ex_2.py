@@ -1,4 +1,4 @@
-from src.udemdatastructures.queue import ArrayQueue
+from .queue import ArrayQueue
 
 
 def is_symmetric(numbers: list[int]) -> bool:
@@ -1,17 +1,31 @@
-from src.udemdatastructures.queue import ArrayQueue
+from .PriorityQueue import IndexedPriorityQueue
 
 
 class Ticketing_system:
     def __init__(self):
-        self.cola_clientes = ArrayQueue()
+        self.cola_clientes = IndexedPriorityQueue()
         self.id = 1
 
-    def llegada_clientes(self):
+    def llegada_clientes(self, prioridad=0):
         cliente_id = self.id
         print (f"El cliente {cliente_id} ha llegado y está en espera")
-        self.cola_clientes.enqueue(cliente_id)
+        self.cola_clientes.enqueue(cliente_id, prioridad)
         self.id +=1
 
+    def cancelar_cliente(self, cliente_id):
+        if cliente_id not in self.cola_clientes:
+            print(f"El cliente {cliente_id} no está en espera")
+        else:
+            self.cola_clientes.remove(cliente_id)
+            print(f"El cliente {cliente_id} ha abandonado la fila")
+
+    def cambiar_prioridad(self, cliente_id, prioridad):
+        if cliente_id not in self.cola_clientes:
+            print(f"El cliente {cliente_id} no está en espera")
+        else:
+            self.cola_clientes.update_priority(cliente_id, prioridad)
+            print(f"El cliente {cliente_id} ahora tiene prioridad {prioridad}")
+
     def atender_cliente(self):
         if self.cola_clientes.is_empty():
             print("No hay ningún cliente en espera")
@@ -20,13 +34,14 @@ class Ticketing_system:
             print(f"Atendiendo al cliente{cliente_id}")
 
 
-taquilla = Ticketing_system()
+if __name__ == "__main__":
+    taquilla = Ticketing_system()
 
-taquilla.llegada_clientes()
-taquilla.llegada_clientes()
-taquilla.llegada_clientes()
+    taquilla.llegada_clientes()
+    taquilla.llegada_clientes()
+    taquilla.llegada_clientes()
 
-taquilla.atender_cliente()
-taquilla.atender_cliente()
-taquilla.atender_cliente()
-taquilla.atender_cliente()
\ No newline at end of file
+    taquilla.atender_cliente()
+    taquilla.atender_cliente()
+    taquilla.atender_cliente()
+    taquilla.atender_cliente()
\ No newline at end of file
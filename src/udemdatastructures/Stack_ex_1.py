@@ -1,4 +1,6 @@
-from stack import ArrayStack
+from pathlib import Path
+
+from .stack import ArrayStack
 
 def reverse_data(archivo_stack):
     pila = ArrayStack()
@@ -9,4 +11,6 @@ def reverse_data(archivo_stack):
     while not pila.is_empty():
         print((pila.pop()))
 
-print(reverse_data("archivo_stack"))
\ No newline at end of file
+
+if __name__ == "__main__":
+    reverse_data(Path(__file__).with_name("archivo_stack"))
\ No newline at end of file
@@ -1,5 +1,5 @@
 
-from stack import ArrayStack
+from .stack import ArrayStack
 
 def matching_delimiters(expresion):
     abierto = ArrayStack()
@@ -14,6 +14,8 @@ def matching_delimiters(expresion):
 
     return abierto.is_empty()
 
-expresion = "[()]"
-print(matching_delimiters(expresion))
+
+if __name__ == "__main__":
+    expresion = "[()]"
+    print(matching_delimiters(expresion))
 
@@ -1,5 +1,5 @@
 
-from stack import ArrayStack
+from .stack import ArrayStack
 
 def is_matched_html(html: str) -> bool:
     stack = ArrayStack[str]()
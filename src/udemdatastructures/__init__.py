@@ -0,0 +1,75 @@
+"""
+Data structures implemented in Python
+
+The names in __all__ can be imported straight from the package. Their submodules are only loaded the first time
+one of their names is used, so importing the package itself does not import any of them.
+
+The PriorityQueue class lives in the PriorityQueue submodule of the same name, so it is reached as
+udemdatastructures.PriorityQueue.PriorityQueue: once the submodule is imported, Python binds its name on the
+package to the module.
+"""
+import importlib
+
+# Type checkers take this as True, at runtime the imports below are skipped and resolved by __getattr__
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .PriorityQueue import BucketPriorityQueue, IndexedPriorityQueue, TopK, merge
+    from .btree import BPlusTree
+    from .dispatcher import Dispatcher, Histogram
+    from .linked_lists import (CircularLinkedList, DoubleEndedLinkedList, DoublyLinkedList, OrderedLinkedList,
+                               SinglyLinkedList, UnrolledLinkedList)
+    from .memory import MemoryFootprint
+    from .queue import ArrayQueue
+    from .scheduler import WeightedRoundRobin
+    from .stack import ArrayStack
+    from .timer_wheel import Timer, TimerWheel
+    from .trees import BinarySearchTree, PersistentBinarySearchTree, TreeSnapshot
+
+
+_EXPORTS = {
+    "ArrayQueue": "queue",
+    "ArrayStack": "stack",
+    "BucketPriorityQueue": "PriorityQueue",
+    "IndexedPriorityQueue": "PriorityQueue",
+    "TopK": "PriorityQueue",
+    "merge": "PriorityQueue",
+    "SinglyLinkedList": "linked_lists",
+    "OrderedLinkedList": "linked_lists",
+    "DoubleEndedLinkedList": "linked_lists",
+    "CircularLinkedList": "linked_lists",
+    "DoublyLinkedList": "linked_lists",
+    "UnrolledLinkedList": "linked_lists",
+    "BinarySearchTree": "trees",
+    "PersistentBinarySearchTree": "trees",
+    "TreeSnapshot": "trees",
+    "BPlusTree": "btree",
+    "Timer": "timer_wheel",
+    "TimerWheel": "timer_wheel",
+    "Dispatcher": "dispatcher",
+    "Histogram": "dispatcher",
+    "WeightedRoundRobin": "scheduler",
+    "MemoryFootprint": "memory",
+}
+
+_SUBMODULES = {
+    "PriorityQueue", "btree", "dispatcher", "linked_lists", "memory", "queue", "scheduler", "stack", "timer_wheel",
+    "trees",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cached so that later lookups do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
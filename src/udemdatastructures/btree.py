@@ -0,0 +1,537 @@
+import io
+import mmap
+import os
+import pickle
+import struct
+import sys
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Any
+
+from .memory import MemoryFootprint, deep_size, footprint, shallow_size
+
+
+_MAGIC = b"UDEMBPT1"
+# magic, page size, root page, page count, number of items, free list head, insertion counter
+_HEADER = struct.Struct("<8sIQQQQQ")
+# page kind, payload length
+_PAGE_HEADER = struct.Struct("<BI")
+# next free page, stored right after the header of a released page
+_FREE_LINK = struct.Struct("<Q")
+
+_FREE = 0
+_LEAF = 1
+_INTERNAL = 2
+
+_NO_PAGE = 0  # Page 0 holds the file header, so it is never a node
+_LARGEST_LINK = 2 ** 63 - 1
+
+
+class _Encoder:
+    """
+    Pickler without memo, so the encoding of a page is the encoding of each of its entries plus a fixed overhead,
+    and the length of an entry can be added to or subtracted from the length of a page
+    """
+    __slots__ = ("_buffer", "_pickler")
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+        self._pickler = pickle.Pickler(self._buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        self._pickler.fast = True
+
+    def encode(self, obj: Any) -> bytes:
+        self._dump(obj)
+        return self._buffer.getvalue()
+
+    def length(self, obj: Any) -> int:
+        """
+        Bytes taken by obj inside a page, without the protocol, frame and stop opcodes of a pickle on its own
+        """
+        self._dump(obj)
+        overhead = 3 + (9 if self._buffer.getbuffer()[2] == pickle.FRAME[0] else 0)
+        return self._buffer.tell() - overhead
+
+    def _dump(self, obj: Any):
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._pickler.dump(obj)
+
+
+def _list_overhead(count: int) -> int:
+    # pickle writes a single item with APPEND, and more items with MARK and APPENDS per batch of up to 1000
+    if count <= 1:
+        return count
+    return 2 * -(-count // 1000)
+
+
+class _Page:
+    """
+    In-memory copy of a node page
+
+    Keys are (key, counter) pairs so that items with equal keys can be stored without ambiguity. Leaves store the
+    items in values and the next leaf in link; internal pages store the child page ids in values. size is the
+    length of the encoded page, kept up to date as entries are added and removed, or None when it is unknown.
+    """
+    __slots__ = ("id", "kind", "keys", "values", "link", "dirty", "size")
+
+    def __init__(self, page_id: int, kind: int, keys: list | None = None, values: list | None = None,
+                 link: int = _NO_PAGE):
+        self.id: int = page_id
+        self.kind: int = kind
+        self.keys: list = keys if keys is not None else []
+        self.values: list = values if values is not None else []
+        self.link: int = link
+        self.dirty: bool = False
+        self.size: int | None = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.kind == _LEAF
+
+    def encode(self, encoder: _Encoder) -> bytes:
+        return encoder.encode((self.keys, self.values, self.link))
+
+    def resize(self, change: int, key_count: int, value_count: int):
+        """
+        Updates size after entries of change bytes were added, or removed if change is negative, to a page that
+        had key_count keys and value_count values
+        """
+        if self.size is not None:
+            self.size += (change + _list_overhead(len(self.keys)) - _list_overhead(key_count)
+                          + _list_overhead(len(self.values)) - _list_overhead(value_count))
+
+
+class BPlusTree[T]:
+    """
+    Disk-resident B+tree with the BinarySearchTree API
+
+    The nodes are stored in fixed-size pages of a memory-mapped file and the most recently used pages are kept
+    decoded in an LRU cache. Leaves are linked, so ordered iteration and range scans read each leaf once.
+    A page is split when its encoded contents no longer fit and merged or rebalanced with a sibling when it falls
+    under a quarter of the page. An item must fit in a leaf page on its own, and its key three times in an
+    internal page.
+
+    Modified pages stay in the cache until they are evicted or flush() or close() is called, so nothing written
+    since the last flush is guaranteed to be in the file, and other BPlusTree objects opened on the same file only
+    see the state of the last flush.
+
+    Pages are encoded with pickle, so only open files from a trusted source: loading a crafted file can run
+    arbitrary code. The pickle memo is turned off so that the length of each page can be kept up to date without
+    encoding it on every change: an object referenced twice in an item is stored twice, and an item that refers to
+    itself cannot be stored.
+
+    Attributes:
+    key: Callable[[Any], Any]
+        The function to extract the key from the data. It is not stored in the file, so the same function must be
+        used every time the file is opened
+    """
+    def __init__(self, path: str | os.PathLike, key=lambda x: x, page_size: int = 4096, cache_size: int = 256):
+        if page_size < 512:
+            raise ValueError("Page size must be at least 512 bytes")
+        if cache_size < 8:
+            raise ValueError("Cache size must be at least 8 pages")
+        self.key = key
+        self._encoder: _Encoder = _Encoder()
+        # Encoded lengths of the smallest pages, with the largest link so that any link fits
+        self._empty_leaf: int = len(_Page(_NO_PAGE, _LEAF, link=_LARGEST_LINK).encode(self._encoder))
+        self._empty_internal: int = len(_Page(_NO_PAGE, _INTERNAL, [], [_LARGEST_LINK] * 4).encode(self._encoder))
+        self._cache: OrderedDict[int, _Page] = OrderedDict()
+        self._cache_size: int = cache_size
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._create(page_size)
+        else:
+            self._open()
+
+    def _create(self, page_size: int):
+        self._page_size: int = page_size
+        self._file.truncate(8 * page_size)
+        self._mm = mmap.mmap(self._file.fileno(), 8 * page_size)
+        self._page_count: int = 1
+        self._size: int = 0
+        self._free: int = _NO_PAGE
+        self._counter: int = 0
+        root = self._allocate(_LEAF)
+        self._root: int = root.id
+        # Written right away so that the file can be opened before the first flush
+        self._write_page(root)
+        self._write_header()
+
+    def _open(self):
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, self._page_size, self._root, self._page_count, self._size, self._free, self._counter = (
+            _HEADER.unpack_from(self._mm, 0))
+        if magic != _MAGIC:
+            self._mm.close()
+            self._file.close()
+            raise ValueError("Not a B+tree file")
+
+    def _write_header(self):
+        _HEADER.pack_into(self._mm, 0, _MAGIC, self._page_size, self._root, self._page_count, self._size,
+                          self._free, self._counter)
+
+    @property
+    def _capacity(self) -> int:
+        return self._page_size - _PAGE_HEADER.size
+
+    @property
+    def _frame_slack(self) -> int:
+        # The running size of a page leaves out the 9-byte frame headers pickle adds every 64 KiB and around items
+        # larger than that
+        return 9 * (2 * (self._capacity // 65536) + 1)
+
+    # Page management
+
+    def _get(self, page_id: int) -> _Page:
+        page = self._cache.get(page_id)
+        if page is not None:
+            self._cache.move_to_end(page_id)
+            return page
+        offset = page_id * self._page_size
+        kind, length = _PAGE_HEADER.unpack_from(self._mm, offset)
+        start = offset + _PAGE_HEADER.size
+        keys, values, link = pickle.loads(self._mm[start:start + length])
+        page = _Page(page_id, kind, keys, values, link)
+        self._cache[page_id] = page
+        self._evict()
+        return page
+
+    def _mark_dirty(self, page: _Page):
+        # The page may have been evicted while the caller held it, so it is put back in the cache
+        page.dirty = True
+        self._cache[page.id] = page
+        self._cache.move_to_end(page.id)
+        self._evict()
+
+    def _evict(self):
+        while len(self._cache) > self._cache_size:
+            _, page = self._cache.popitem(last=False)
+            if page.dirty:
+                self._write_page(page)
+
+    def _write_page(self, page: _Page):
+        payload = page.encode(self._encoder)
+        if len(payload) > self._capacity:
+            raise ValueError("Page overflow")
+        page.size = len(payload)
+        offset = page.id * self._page_size
+        _PAGE_HEADER.pack_into(self._mm, offset, page.kind, len(payload))
+        start = offset + _PAGE_HEADER.size
+        self._mm[start:start + len(payload)] = payload
+        page.dirty = False
+
+    def _allocate(self, kind: int) -> _Page:
+        if self._free != _NO_PAGE:
+            page_id = self._free
+            (self._free,) = _FREE_LINK.unpack_from(self._mm, page_id * self._page_size + _PAGE_HEADER.size)
+        else:
+            page_id = self._page_count
+            self._page_count += 1
+            if self._page_count * self._page_size > len(self._mm):
+                self._grow(2 * len(self._mm))
+        page = _Page(page_id, kind)
+        self._mark_dirty(page)
+        return page
+
+    def _release(self, page: _Page):
+        self._cache.pop(page.id, None)
+        offset = page.id * self._page_size
+        _PAGE_HEADER.pack_into(self._mm, offset, _FREE, 0)
+        # The free list is threaded through the released pages
+        _FREE_LINK.pack_into(self._mm, offset + _PAGE_HEADER.size, self._free)
+        self._free = page.id
+
+    def _grow(self, size: int):
+        self._mm.close()
+        self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+
+    def _length(self, page: _Page) -> int:
+        # A page is only encoded when its size is unknown or close to the limit
+        if page.size is None or page.size > self._capacity - self._frame_slack:
+            page.size = len(page.encode(self._encoder))
+        return page.size
+
+    def _fits(self, page: _Page) -> bool:
+        return self._length(page) <= self._capacity
+
+    def _is_underfull(self, page: _Page) -> bool:
+        return not page.keys or self._length(page) < self._capacity // 4
+
+    # Insertion
+
+    def insert(self, data: T):
+        """
+        :raises ValueError: If the item does not fit in a page, in which case the tree is not modified
+        """
+        full_key = (self.key(data), self._counter)
+        key_length = self._encoder.length(full_key)
+        item_length = key_length + self._encoder.length(data)
+        self._check_fits(key_length, item_length)
+        self._counter += 1
+        splits = self._insert(self._get(self._root), full_key, data, item_length)
+        if splits:
+            old_root = self._root
+            root = self._allocate(_INTERNAL)
+            root.keys = [separator for separator, _ in splits]
+            root.values = [old_root] + [page_id for _, page_id in splits]
+            self._root = root.id
+            self._mark_dirty(root)
+            # The new root may not fit if the separators are very large
+            self._grow_root(root)
+        self._size += 1
+
+    def _check_fits(self, key_length: int, item_length: int):
+        if self._empty_leaf + item_length + 2 * _list_overhead(1) > self._capacity:
+            raise ValueError("Item too large for page")
+        # An internal page must hold at least three separators to be split
+        if self._empty_internal + 3 * key_length + _list_overhead(3) > self._capacity:
+            raise ValueError("Key too large for page")
+
+    def _grow_root(self, root: _Page):
+        while not self._fits(root):
+            splits = self._split(root)
+            new_root = self._allocate(_INTERNAL)
+            new_root.keys = [separator for separator, _ in splits]
+            new_root.values = [root.id] + [page_id for _, page_id in splits]
+            self._root = new_root.id
+            self._mark_dirty(new_root)
+            root = new_root
+
+    def _insert(self, page: _Page, full_key: tuple, data: T, item_length: int) -> list[tuple[tuple, int]]:
+        """
+        Inserts the item under page and returns the (separator, page id) pairs of the pages split off of it
+        """
+        key_count, value_count = len(page.keys), len(page.values)
+        if page.is_leaf:
+            position = bisect_left(page.keys, full_key)
+            page.keys.insert(position, full_key)
+            page.values.insert(position, data)
+            page.resize(item_length, key_count, value_count)
+        else:
+            position = bisect_right(page.keys, full_key)
+            splits = self._insert(self._get(page.values[position]), full_key, data, item_length)
+            if not splits:
+                return []
+            page.keys[position:position] = [separator for separator, _ in splits]
+            page.values[position + 1:position + 1] = [page_id for _, page_id in splits]
+            page.resize(self._entries_length(splits), key_count, value_count)
+        self._mark_dirty(page)
+        if self._fits(page):
+            return []
+        return self._split(page)
+
+    def _split(self, page: _Page) -> list[tuple[tuple, int]]:
+        count = len(page.keys)
+        if count < (2 if page.is_leaf else 3):
+            raise ValueError("Item too large for page")
+        middle = count // 2
+        right = self._allocate(page.kind)
+        if page.is_leaf:
+            separator = page.keys[middle]
+            right.keys, page.keys = page.keys[middle:], page.keys[:middle]
+            right.values, page.values = page.values[middle:], page.values[:middle]
+            right.link, page.link = page.link, right.id
+        else:
+            separator = page.keys[middle]
+            right.keys, page.keys = page.keys[middle + 1:], page.keys[:middle]
+            right.values, page.values = page.values[middle + 1:], page.values[:middle + 1]
+        page.size = right.size = None
+        self._mark_dirty(page)
+        self._mark_dirty(right)
+        # Either half may still be too big when the items have very different sizes
+        left_splits = self._split(page) if not self._fits(page) else []
+        right_splits = self._split(right) if not self._fits(right) else []
+        return left_splits + [(separator, right.id)] + right_splits
+
+    def _entries_length(self, entries) -> int:
+        return sum(self._encoder.length(key) + self._encoder.length(value) for key, value in entries)
+
+    # Search
+
+    def _first_at_least(self, probe: tuple) -> tuple[_Page, int]:
+        """
+        Returns the leaf and position of the first item whose full key is not less than probe
+        """
+        page = self._get(self._root)
+        while not page.is_leaf:
+            page = self._get(page.values[bisect_right(page.keys, probe)])
+        position = bisect_left(page.keys, probe)
+        # Items equal to the probe may start at the beginning of the next leaf
+        while position == len(page.keys) and page.link != _NO_PAGE:
+            page = self._get(page.link)
+            position = 0
+        return page, position
+
+    def _find(self, goal: Any) -> tuple | None:
+        goal_key = self.key(goal)
+        page, position = self._first_at_least((goal_key,))
+        if position < len(page.keys) and page.keys[position][0] == goal_key:
+            return page.keys[position]
+        return None
+
+    def search(self, goal: Any) -> bool:
+        return self._find(goal) is not None
+
+    def __contains__(self, goal: Any) -> bool:
+        return self.search(goal)
+
+    def range(self, start: Any = None, stop: Any = None):
+        """
+        Yields, in key order, the items whose keys are in [start, stop). A missing bound leaves that side open
+        """
+        if start is None:
+            page = self._get(self._root)
+            while not page.is_leaf:
+                page = self._get(page.values[0])
+            position = 0
+        else:
+            page, position = self._first_at_least((start,))
+        while True:
+            keys, values, link = page.keys, page.values, page.link
+            for index in range(position, len(keys)):
+                if stop is not None and not keys[index][0] < stop:
+                    return
+                yield values[index]
+            if link == _NO_PAGE:
+                return
+            page = self._get(link)
+            position = 0
+
+    def __iter__(self):
+        return self.range()
+
+    # Deletion
+
+    def delete(self, goal: Any):
+        """
+        Deletes the first item whose key matches the key of goal. Does nothing if there is no such item
+        """
+        full_key = self._find(goal)
+        if full_key is None:
+            return
+        root = self._get(self._root)
+        self._delete(root, full_key)
+        if not root.is_leaf and not root.keys:
+            self._root = root.values[0]
+            self._release(root)
+        self._size -= 1
+
+    def _delete(self, page: _Page, full_key: tuple):
+        if page.is_leaf:
+            position = bisect_left(page.keys, full_key)
+            removed = self._entries_length([(page.keys[position], page.values[position])])
+            del page.keys[position]
+            del page.values[position]
+            page.resize(-removed, len(page.keys) + 1, len(page.values) + 1)
+            self._mark_dirty(page)
+            return
+        position = bisect_right(page.keys, full_key)
+        child = self._get(page.values[position])
+        self._delete(child, full_key)
+        if self._is_underfull(child):
+            self._rebalance(page, position)
+
+    def _rebalance(self, parent: _Page, position: int):
+        """
+        Merges the child at position with a sibling, or moves items between them when the merge does not fit
+        """
+        if position == len(parent.values) - 1:
+            position -= 1
+        left = self._get(parent.values[position])
+        right = self._get(parent.values[position + 1])
+        if left.is_leaf:
+            keys, values = left.keys + right.keys, left.values + right.values
+        else:
+            keys, values = left.keys + [parent.keys[position]] + right.keys, left.values + right.values
+        merged = _Page(left.id, left.kind, keys, values, right.link if left.is_leaf else _NO_PAGE)
+        if self._fits(merged):
+            left.keys, left.values, left.link, left.size = merged.keys, merged.values, merged.link, merged.size
+            removed = self._entries_length([(parent.keys[position], parent.values[position + 1])])
+            del parent.keys[position]
+            del parent.values[position + 1]
+            parent.resize(-removed, len(parent.keys) + 1, len(parent.values) + 1)
+            self._mark_dirty(left)
+            self._mark_dirty(parent)
+            self._release(right)
+            return
+
+        middle = len(keys) // 2
+        if left.is_leaf:
+            new_left = _Page(left.id, left.kind, keys[:middle], values[:middle], right.id)
+            new_right = _Page(right.id, right.kind, keys[middle:], values[middle:], right.link)
+            separator = keys[middle]
+        else:
+            new_left = _Page(left.id, left.kind, keys[:middle], values[:middle + 1])
+            new_right = _Page(right.id, right.kind, keys[middle + 1:], values[middle + 1:])
+            separator = keys[middle]
+        # With items of very different sizes an even split may not fit, the pages are then left as they are
+        if not (self._fits(new_left) and self._fits(new_right)):
+            return
+        for old, new in ((left, new_left), (right, new_right)):
+            old.keys, old.values, old.link, old.size = new.keys, new.values, new.link, new.size
+            self._mark_dirty(old)
+        change = self._encoder.length(separator) - self._encoder.length(parent.keys[position])
+        parent.keys[position] = separator
+        parent.resize(change, len(parent.keys), len(parent.values))
+        self._mark_dirty(parent)
+
+    # File handling
+
+    def flush(self):
+        """
+        Writes every modified page and the header to the file
+        """
+        for page in self._cache.values():
+            if page.dirty:
+                self._write_page(page)
+        self._write_header()
+        self._mm.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._cache.clear()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def page_count(self) -> int:
+        """
+        The number of pages in the file, including the header page and the released ones
+        """
+        return self._page_count
+
+    @property
+    def cached_pages(self) -> int:
+        return len(self._cache)
+
+    def memory_footprint(self) -> MemoryFootprint:
+        """
+        Memory used by the decoded pages in the cache. The elements are the items of the cached leaves; the file
+        itself takes page_count pages of the page size
+        """
+        structure = shallow_size(self) + sys.getsizeof(self._cache)
+        seen: set[int] = set()
+        for page in self._cache.values():
+            structure += shallow_size(page) + sys.getsizeof(page.values) + deep_size(page.keys, seen)
+            if not page.is_leaf:
+                structure += deep_size(page.values, seen)
+        elements = (item for page in self._cache.values() if page.is_leaf for item in page.values)
+        return footprint(structure, elements)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def __len__(self) -> int:
+        return self._size
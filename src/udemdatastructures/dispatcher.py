@@ -0,0 +1,319 @@
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from .queue import ArrayQueue
+
+
+_logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """
+    Histogram of durations in seconds with power-of-two buckets starting at one microsecond
+
+    Attributes:
+    count: int
+        The number of recorded values
+    total: float
+        The sum of the recorded values
+    maximum: float
+        The largest recorded value
+    """
+    SMALLEST = 1e-6
+
+    def __init__(self):
+        self._buckets: list[int] = []
+        self.count: int = 0
+        self.total: float = 0.0
+        self.maximum: float = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, value: float):
+        index = 0 if value <= Histogram.SMALLEST else math.ceil(math.log2(value / Histogram.SMALLEST))
+        with self._lock:
+            if index >= len(self._buckets):
+                self._buckets.extend([0] * (index + 1 - len(self._buckets)))
+            self._buckets[index] += 1
+            self.count += 1
+            self.total += value
+            self.maximum = max(self.maximum, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Returns the upper bound of the bucket that holds the p-th percentile (0 < p <= 100)
+        """
+        with self._lock:
+            rank = math.ceil(self.count * p / 100)
+            seen = 0
+            for index, count in enumerate(self._buckets):
+                seen += count
+                if seen >= rank > 0:
+                    return min(Histogram.SMALLEST * 2 ** index, self.maximum)
+            return 0.0
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        Returns the (upper bound, count) pairs of the buckets
+        """
+        with self._lock:
+            return [(Histogram.SMALLEST * 2 ** index, count) for index, count in enumerate(self._buckets)]
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, mean={self.mean:.6f}, p99={self.percentile(99):.6f})"
+
+
+class _Job:
+    __slots__ = ("item", "enqueued_at")
+
+    def __init__(self, item: Any, enqueued_at: float | None):
+        self.item = item
+        self.enqueued_at = enqueued_at
+
+
+def _handle_batch(handler: Callable[[Any], Any], items: list) -> list[tuple[Exception | None, float]]:
+    """
+    Runs the handler on each item of a batch in a worker process and returns the error, or None, and the duration
+    of each call
+    """
+    outcomes = []
+    for item in items:
+        started_at = time.perf_counter()
+        try:
+            handler(item)
+            error = None
+        except Exception as caught:
+            error = caught
+        outcomes.append((error, time.perf_counter() - started_at))
+    return outcomes
+
+
+class Dispatcher[T]:
+    """
+    Pool of workers that handle the items of an ArrayQueue-compatible queue
+
+    Each worker moves up to batch_size items at a time from the shared queues to its own local queue, so the shared
+    lock is taken once per batch. A worker whose local queue and the shared queues are empty steals half of the
+    local queue of another worker. The handler runs in the worker threads, or in a process pool when
+    use_processes is True, in which case the handler and the items must be picklable and each batch is sent to
+    the pool as a single task. The service time is then measured in the worker process with time.perf_counter.
+
+    The items already in queue are handled first. Items added with submit go to a private queue along with the
+    time they were submitted, so the queue wait time (submit to start) and the service time (start to end) of
+    each item are recorded in histograms; the items of queue have no wait time. The queues are read under the
+    dispatcher lock and ArrayQueue is not thread safe, so once start() is called, items must only be added with
+    submit and nothing else may dequeue from queue until shutdown() returns.
+
+    An exception raised by the handler is passed with its item to on_error, or logged when there is no on_error,
+    and the last max_errors (item, exception) pairs are kept in errors.
+    """
+    def __init__(self, handler: Callable[[T], Any], workers: int = 4, batch_size: int = 1, queue: Any = None,
+                 use_processes: bool = False, clock: Callable[[], float] = time.perf_counter,
+                 on_error: Callable[[T, Exception], Any] | None = None, max_errors: int = 100):
+        if workers < 1 or batch_size < 1:
+            raise ValueError("There must be at least one worker and one item per batch")
+        self.handler: Callable[[T], Any] = handler
+        self.batch_size: int = batch_size
+        self.wait_time: Histogram = Histogram()
+        self.service_time: Histogram = Histogram()
+        self.completed: int = 0
+        self.failed: int = 0
+        self.on_error: Callable[[T, Exception], Any] | None = on_error
+        self.errors: deque[tuple[T, Exception]] = deque(maxlen=max_errors)
+        self._queue = queue if queue is not None else ArrayQueue()
+        self._submitted: ArrayQueue[_Job] = ArrayQueue()
+        self._clock: Callable[[], float] = clock
+        self._condition = threading.Condition()
+        self._locals: list[deque[_Job]] = [deque() for _ in range(workers)]
+        self._threads: list[threading.Thread] = [
+            threading.Thread(target=self._work, args=(index,), daemon=True) for index in range(workers)
+        ]
+        self._executor = None
+        if use_processes:
+            # Imported here because concurrent.futures.process loads multiprocessing, which thread workers never use
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._closed: bool = False
+        self._aborted: bool = False
+
+    def start(self):
+        if self._started_at is not None:
+            raise ValueError("Dispatcher already started")
+        self._started_at = self._clock()
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, item: T):
+        with self._condition:
+            if self._closed:
+                raise ValueError("Dispatcher is shut down")
+            self._submitted.enqueue(_Job(item, self._clock()))
+            self._condition.notify()
+
+    def shutdown(self, drain: bool = True, timeout: float | None = None) -> list[T]:
+        """
+        Stops accepting items and stops the workers
+
+        :param drain: If True the workers handle every queued item before stopping, otherwise they stop after
+            their current item
+        :param timeout: The maximum time to wait for each worker
+        :return: list[T] - The items that were not handled
+        """
+        with self._condition:
+            self._closed = True
+            self._aborted = not drain
+            self._condition.notify_all()
+        if self._started_at is not None:
+            for thread in self._threads:
+                thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=drain)
+        with self._condition:
+            pending = [job.item for local in self._locals for job in local]
+            for local in self._locals:
+                local.clear()
+            while not self._queue.is_empty():
+                pending.append(self._queue.dequeue())
+            while not self._submitted.is_empty():
+                pending.append(self._submitted.dequeue().item)
+        return pending
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(drain=exc_type is None)
+
+    def _work(self, index: int):
+        local = self._locals[index]
+        while not self._aborted:
+            job = self._next_job(index, local)
+            if job is None:
+                with self._condition:
+                    if (self._closed and self._queue.is_empty() and self._submitted.is_empty()
+                            and not any(self._locals)):
+                        return
+                    self._condition.wait(0.05)
+            elif self._executor is None:
+                self._run(job)
+            else:
+                batch = [job]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(local.popleft())
+                    except IndexError:
+                        break
+                self._run_batch(batch)
+
+    def _next_job(self, index: int, local: deque[_Job]) -> _Job | None:
+        try:
+            return local.popleft()
+        except IndexError:
+            pass
+        with self._condition:
+            for _ in range(self.batch_size):
+                if not self._queue.is_empty():
+                    local.append(_Job(self._queue.dequeue(), None))
+                elif not self._submitted.is_empty():
+                    local.append(self._submitted.dequeue())
+                else:
+                    break
+        if local:
+            return local.popleft()
+        return self._steal(index, local)
+
+    def _steal(self, index: int, local: deque[_Job]) -> _Job | None:
+        victims = [other for position, other in enumerate(self._locals) if position != index and other]
+        random.shuffle(victims)
+        for victim in victims:
+            # The owner takes from the left end, thieves from the right one
+            for _ in range(max(1, len(victim) // 2)):
+                try:
+                    local.appendleft(victim.pop())
+                except IndexError:
+                    break
+            if local:
+                return local.popleft()
+        return None
+
+    def _run(self, job: _Job):
+        started_at = self._clock()
+        self._record_wait(job, started_at)
+        try:
+            self.handler(job.item)
+            error = None
+        except Exception as caught:
+            error = caught
+        finished_at = self._clock()
+        self._finish(job.item, error, finished_at - started_at, finished_at)
+
+    def _run_batch(self, batch: list[_Job]):
+        started_at = self._clock()
+        for job in batch:
+            self._record_wait(job, started_at)
+        try:
+            outcomes = self._executor.submit(_handle_batch, self.handler, [job.item for job in batch]).result()
+        except Exception as error:
+            # The batch could not be sent or the pool is broken, so all of its items failed
+            share = (self._clock() - started_at) / len(batch)
+            outcomes = [(error, share)] * len(batch)
+        finished_at = self._clock()
+        for job, (error, duration) in zip(batch, outcomes):
+            self._finish(job.item, error, duration, finished_at)
+
+    def _record_wait(self, job: _Job, started_at: float):
+        if job.enqueued_at is not None:
+            self.wait_time.record(started_at - job.enqueued_at)
+
+    def _finish(self, item: T, error: Exception | None, duration: float, finished_at: float):
+        self.service_time.record(duration)
+        if error is not None:
+            self._report(item, error)
+        with self._condition:
+            if error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self._finished_at = finished_at
+
+    def _report(self, item: T, error: Exception):
+        with self._condition:
+            self.errors.append((item, error))
+        if self.on_error is None:
+            _logger.error("Handler failed for %r", item, exc_info=error)
+            return
+        try:
+            self.on_error(item, error)
+        except Exception:
+            _logger.exception("Error callback failed for %r", item)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Handled items per second between the start and the last finished item
+        """
+        if self._started_at is None or self._finished_at is None or self._finished_at == self._started_at:
+            return 0.0
+        return (self.completed + self.failed) / (self._finished_at - self._started_at)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "errors": list(self.errors),
+            "throughput": self.throughput,
+            "wait_time": self.wait_time,
+            "service_time": self.service_time,
+        }
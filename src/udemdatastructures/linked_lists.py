@@ -1,6 +1,9 @@
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
 from typing import Any, override
 
+from .memory import MemoryFootprint, footprint, list_capacity, shallow_size
+
 
 _KEY_NOT_FOUND = "Key not found"
 _LIST_IS_EMPTY = "List is empty"
@@ -20,11 +23,100 @@ class Node[T]:
     next: Node[T] | None
         The next node in the linked list
     """
+    __slots__ = ("data", "next")
+
     def __init__(self, data: T):
         self.data: T = data
         self.next: Node[T] | None = None
 
 
+def _split_chain(node, count: int):
+    """
+    Cuts a node chain after its first count nodes and returns the head of the rest
+    """
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _data(node) -> Any:
+    return node.data
+
+
+def _merge_chains(left, right, node_key: Callable[[Any], Any], reverse: bool = False) -> tuple:
+    """
+    Merges two sorted node chains by relinking their nodes. On equal keys the nodes of left go first. node_key
+    takes a node and is called at most once per node
+
+    :return: tuple - The head and the tail of the merged chain
+    """
+    sentinel = Node(None)
+    tail = sentinel
+    if left is not None and right is not None:
+        left_key = node_key(left)
+        right_key = node_key(right)
+        while True:
+            if left_key < right_key if reverse else right_key < left_key:
+                tail.next, right = right, right.next
+                tail = tail.next
+                if right is None:
+                    break
+                right_key = node_key(right)
+            else:
+                tail.next, left = left, left.next
+                tail = tail.next
+                if left is None:
+                    break
+                left_key = node_key(left)
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return sentinel.next, tail
+
+
+def _sort_chain(head, key: Callable[[Any], Any], reverse: bool = False) -> tuple:
+    """
+    Stable bottom-up merge sort of a node chain. It merges runs of width 1, 2, 4... without recursion and without
+    copying the data. The key of each node is computed once, before the first merge
+
+    :return: tuple - The head and the tail of the sorted chain
+    """
+    length = 0
+    tail = head
+    current = head
+    keys: dict[int, Any] = {}
+    while current is not None:
+        length += 1
+        tail = current
+        if key is not _identity:
+            keys[id(current)] = key(current.data)
+        current = current.next
+    node_key = _data if key is _identity else lambda node: keys[id(node)]
+
+    sentinel = Node(None)
+    sentinel.next = head
+    width = 1
+    while width < length:
+        previous = sentinel
+        current = sentinel.next
+        while current is not None:
+            left = current
+            right = _split_chain(left, width)
+            current = _split_chain(right, width)
+            merged_head, merged_tail = _merge_chains(left, right, node_key, reverse)
+            previous.next = merged_head
+            previous = merged_tail
+        tail = previous
+        width *= 2
+    return sentinel.next, tail
+
+
 class SinglyLinkedList[T]:
     """
     SinglyLinkedList class
@@ -110,6 +202,15 @@ class SinglyLinkedList[T]:
             current = next_node
         self.head = previous
 
+    def sort(self, key: Callable[[T], Any] = _identity, reverse: bool = False) -> None:
+        """
+        Sort the linked list in place with a stable O(n log n) merge sort that relinks the nodes
+
+        :param key: The function to extract the key from the data. Default is the identity function
+        :param reverse: If True the list is sorted in descending order
+        """
+        self.head, _ = _sort_chain(self.head, key, reverse)
+
     def find(self, goal: Any, key: Callable[[T], Any] = _identity) -> Node[T] | None:
         """
         Find the first node with a specific key
@@ -181,6 +282,18 @@ class SinglyLinkedList[T]:
             yield current.data
             current = current.next
 
+    def memory_footprint(self) -> MemoryFootprint:
+        """
+        Report the memory used by the linked list, its nodes and its elements
+        :return: MemoryFootprint - The deep size, slack and per-element overhead
+        """
+        # Every node has the same size because its attributes are slots
+        node_size = sys.getsizeof(self.head) if self.head else 0
+        return footprint(shallow_size(self), self, per_element_bytes=node_size)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
     def __repr__(self) -> str:
         return f"SinglyLinkedList([{', '.join(repr(data) for data in self)}])"
 
@@ -202,6 +315,37 @@ class OrderedLinkedList[T](SinglyLinkedList):
         super().__init__()
         self.key: Callable[[Any], Any] = key
 
+    @classmethod
+    def from_iterable(cls, items: Iterable[T], key: Callable[[Any], Any] = _identity) -> "OrderedLinkedList[T]":
+        """
+        Build an ordered linked list in O(n log n) by linking the items and merge sorting the nodes
+
+        :param items: Iterable[T] - The items to store. Items with equal keys keep their order
+        :param key: The function to extract the key from the data. Default is the identity function
+        """
+        ordered = cls(key)
+        sentinel = Node(None)
+        tail = sentinel
+        for data in items:
+            tail.next = Node(data)
+            tail = tail.next
+        ordered.head, _ = _sort_chain(sentinel.next, key)
+        return ordered
+
+    def merge(self, other: "OrderedLinkedList[T]") -> None:
+        """
+        Merge another ordered linked list into this one in O(n + m) by relinking the nodes of both. The other list
+        is left empty
+
+        :param other: OrderedLinkedList[T] - The list to merge, ordered by the same key
+        :raises ValueError: If other is this list
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        key = self.key
+        self.head, _ = _merge_chains(self.head, other.head, lambda node: key(node.data))
+        other.head = None
+
     @override
     def insert(self, data: T) -> None:
         """
@@ -246,6 +390,10 @@ class OrderedLinkedList[T](SinglyLinkedList):
     def append(self, data: T):
         raise NotImplementedError("append is not supported for OrderedLinkedList")
 
+    @override
+    def sort(self, key: Callable[[T], Any] = _identity, reverse: bool = False):
+        raise NotImplementedError("sort is not supported for OrderedLinkedList")
+
     def __repr__(self):
         return f"OrderedLinkedList([{', '.join(repr(data) for data in self)}])"
 
@@ -310,6 +458,10 @@ class DoubleEndedLinkedList[T](SinglyLinkedList):
         super().reverse()
         self.head, self.tail = self.tail, self.head
 
+    @override
+    def sort(self, key: Callable[[T], Any] = _identity, reverse: bool = False) -> None:
+        self.head, self.tail = _sort_chain(self.head, key, reverse)
+
 
 class CircularLinkedList[T](DoubleEndedLinkedList[T]):
     """
@@ -317,10 +469,30 @@ class CircularLinkedList[T](DoubleEndedLinkedList[T]):
 
     The CircularLinkedList class is a subclass of DoubleEndedLinkedList that maintains a reference to the tail of the
     linked list.
+
+    The head works as a round-robin cursor: next() returns the element at the head and moves the head and the tail
+    one node forward, and remove_current() unlinks the head through the tail. Both are O(1). Every mutator keeps
+    count of the nodes, so len() is O(1) as well.
     """
 
     def __init__(self):
         super().__init__()
+        self._size: int = 0
+
+    @override
+    def insert(self, data: T) -> None:
+        new_node = Node(data)
+        if self.is_empty():
+            self.head = new_node
+            self.tail = new_node
+            self.head.next = self.head
+            self._size = 1
+            return
+
+        new_node.next = self.head
+        self.head = new_node
+        self.tail.next = self.head
+        self._size += 1
 
     @override
     def append(self, data: T) -> None:
@@ -329,11 +501,13 @@ class CircularLinkedList[T](DoubleEndedLinkedList[T]):
             self.head = new_node
             self.tail = new_node
             self.head.next = self.head
+            self._size = 1
             return
 
         self.tail.next = new_node
         self.tail = new_node
         self.tail.next = self.head
+        self._size += 1
 
     @override
     def insert_at(self, new_data: T, goal: Any, key: Callable[[Any], Any] = _identity) -> None:
@@ -346,11 +520,86 @@ class CircularLinkedList[T](DoubleEndedLinkedList[T]):
                 new_node = Node(new_data)
                 new_node.next = current.next
                 current.next = new_node
+                if current == self.tail:
+                    self.tail = new_node
+                self._size += 1
+                return
+            if current == self.tail:
+                raise KeyError(_KEY_NOT_FOUND)
+            current = current.next
+
+    @override
+    def delete(self, goal: Any, key: Callable[[Any], Any] = _identity) -> None:
+        if self.is_empty():
+            raise ValueError(_LIST_IS_EMPTY)
+
+        previous = self.tail
+        current = self.head
+        while True:
+            if key(current.data) == goal:
+                self._unlink(previous, current)
                 return
             if current == self.tail:
                 raise KeyError(_KEY_NOT_FOUND)
+            previous = current
             current = current.next
 
+    def _unlink(self, previous: Node[T], node: Node[T]) -> None:
+        if node is previous:
+            self.clear()
+            return
+        self._size -= 1
+        previous.next = node.next
+        if node is self.head:
+            self.head = node.next
+        if node is self.tail:
+            self.tail = previous
+
+    def rotate(self, n: int = 1) -> None:
+        """
+        Move the head n positions forward, or backward if n is negative, without relinking any node
+
+        :param n: int - The number of positions. It is reduced modulo the length, so at most len - 1 nodes are
+            visited
+        """
+        if self.is_empty():
+            return
+        for _ in range(n % self._size):
+            self.tail = self.head
+            self.head = self.head.next
+
+    def current(self) -> T:
+        """
+        Return the element at the cursor, which is the head
+
+        :raises ValueError: If the linked list is empty
+        """
+        if self.is_empty():
+            raise ValueError(_LIST_IS_EMPTY)
+        return self.head.data
+
+    def next(self) -> T:
+        """
+        Return the element at the cursor and move the cursor to the following element in O(1)
+
+        :raises ValueError: If the linked list is empty
+        """
+        data = self.current()
+        self.tail = self.head
+        self.head = self.head.next
+        return data
+
+    def remove_current(self) -> T:
+        """
+        Remove the element at the cursor in O(1). The cursor moves to the following element
+
+        :return: T - The removed element
+        :raises ValueError: If the linked list is empty
+        """
+        data = self.current()
+        self._unlink(self.tail, self.head)
+        return data
+
     @override
     def find(self, goal: Any, key: Callable[[T], Any] = _identity) -> Node[T] | None:
         if self.is_empty():
@@ -365,16 +614,22 @@ class CircularLinkedList[T](DoubleEndedLinkedList[T]):
             current = current.next
 
     @override
-    def __len__(self):
+    def sort(self, key: Callable[[T], Any] = _identity, reverse: bool = False) -> None:
         if self.is_empty():
-            return 0
+            return
+        self.tail.next = None
+        self.head, self.tail = _sort_chain(self.head, key, reverse)
+        self.tail.next = self.head
 
-        count = 1
-        current = self.head
-        while current != self.tail:
-            count += 1
-            current = current.next
-        return count
+    @override
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self._size = 0
+
+    @override
+    def __len__(self):
+        return self._size
 
     @override
     def __iter__(self):
@@ -402,6 +657,8 @@ class DoublyNode[T]:
     prev: DoublyNode[T] | None
         The previous node in the linked list
     """
+    __slots__ = ("data", "next", "prev")
+
     def __init__(self, data: T):
         self.data: T = data
         self.next: DoublyNode[T] | None = None
@@ -496,6 +753,22 @@ class DoublyLinkedList[T]:
             current = next_node
         self.head = previous
 
+    def sort(self, key: Callable[[T], Any] = _identity, reverse: bool = False) -> None:
+        """
+        Sort the linked list in place with a stable O(n log n) merge sort that relinks the nodes
+
+        :param key: Callable[[T], Any] - The function to extract the key from the data. Default is the identity
+            function
+        :param reverse: bool - If True the list is sorted in descending order
+        """
+        self.head, _ = _sort_chain(self.head, key, reverse)
+        previous = None
+        current = self.head
+        while current:
+            current.prev = previous
+            previous = current
+            current = current.next
+
     def find(self, goal: Any, key: Callable[[T], Any] = _identity) -> DoublyNode[T] | None:
         """
         Find the first node with a specific key
@@ -565,6 +838,19 @@ class DoublyLinkedList[T]:
             yield current.data
             current = current.next
 
+    def memory_footprint(self) -> MemoryFootprint:
+        """
+        Report the memory used by the linked list, its nodes and its elements
+
+        :return: MemoryFootprint - The deep size, slack and per-element overhead
+        """
+        # Every node has the same size because its attributes are slots
+        node_size = sys.getsizeof(self.head) if self.head else 0
+        return footprint(shallow_size(self), self, per_element_bytes=node_size)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
     def __str__(self) -> str:
         current = self.head
         result = []
@@ -575,3 +861,254 @@ class DoublyLinkedList[T]:
 
     def __repr__(self) -> str:
         return f"DoublyLinkedList([{', '.join(repr(data) for data in self)}])"
+
+
+class UnrolledNode[T]:
+    """
+    UnrolledNode class
+
+    Node class for UnrolledLinkedList
+
+    Attributes:
+    items: list[T]
+        The data stored in the node, at most the capacity of the list
+    next: UnrolledNode[T] | None
+        The next node in the linked list
+    """
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: list[T] | None = None):
+        self.items: list[T] = items if items is not None else []
+        self.next: UnrolledNode[T] | None = None
+
+
+class UnrolledLinkedList[T]:
+    """
+    UnrolledLinkedList class
+
+    Linked list whose nodes hold up to capacity items each, which saves one node object per item and lets
+    iteration walk an array instead of following a pointer per item. A full node is split in two on insertion and a
+    node that falls under half full is merged with, or takes items from, the next node on deletion.
+
+    Attributes:
+    head: UnrolledNode[T] | None
+        The head of the linked list
+    tail: UnrolledNode[T] | None
+        The tail of the linked list
+    capacity: int
+        The maximum number of items per node
+    """
+    def __init__(self, capacity: int = 16):
+        if capacity < 2:
+            raise ValueError("Capacity must be at least 2")
+        self.head: UnrolledNode[T] | None = None
+        self.tail: UnrolledNode[T] | None = None
+        self.capacity: int = capacity
+        self._size: int = 0
+
+    def is_empty(self) -> bool:
+        """
+        Check if the linked list is empty
+        :return: bool - True if the linked list is empty, False otherwise
+        """
+        return self.head is None
+
+    def insert(self, data: T) -> None:
+        """
+        Insert a new item at the beginning of the linked list
+        :param data: T - The data to be stored
+        """
+        if self.is_empty():
+            self.head = self.tail = UnrolledNode([data])
+        else:
+            self._insert_into(self.head, 0, data)
+        self._size += 1
+
+    def append(self, data: T) -> None:
+        """
+        Append a new item at the end of the linked list
+
+        :param data: T - The data to be stored
+        """
+        if self.is_empty():
+            self.head = self.tail = UnrolledNode([data])
+        elif len(self.tail.items) == self.capacity:
+            # A new node instead of a split keeps the nodes full when the list is built by appending
+            self.tail.next = UnrolledNode([data])
+            self.tail = self.tail.next
+        else:
+            self.tail.items.append(data)
+        self._size += 1
+
+    def insert_at(self, new_data: T, goal: Any, key: Callable[[Any], Any] = _identity) -> None:
+        """
+        Insert a new item after the first item with a specific key
+
+        :param new_data: The data to be stored
+        :param goal: The key to search for
+        :param key: The function to extract the key from the data. Default is the identity function
+
+        :raises ValueError: If the linked list is empty
+        :raises KeyError: If the key is not found
+        """
+        if self.is_empty():
+            raise ValueError(_LIST_IS_EMPTY)
+        current = self.head
+        while current:
+            for index, data in enumerate(current.items):
+                if key(data) == goal:
+                    self._insert_into(current, index + 1, new_data)
+                    self._size += 1
+                    return
+            current = current.next
+        raise KeyError(_KEY_NOT_FOUND)
+
+    def _insert_into(self, node: UnrolledNode[T], index: int, data: T) -> None:
+        if len(node.items) == self.capacity:
+            half = self.capacity // 2
+            new_node = UnrolledNode(node.items[half:])
+            del node.items[half:]
+            new_node.next = node.next
+            node.next = new_node
+            if node is self.tail:
+                self.tail = new_node
+            if index > half:
+                node, index = new_node, index - half
+        node.items.insert(index, data)
+
+    def reverse(self) -> None:
+        """
+        Reverse the linked list in place
+
+        :raises ValueError: If the linked list is empty
+        """
+        if self.is_empty():
+            raise ValueError(_LIST_IS_EMPTY)
+        previous = None
+        current = self.head
+        while current:
+            current.items.reverse()
+            next_node = current.next
+            current.next = previous
+            previous = current
+            current = next_node
+        self.head, self.tail = self.tail, self.head
+
+    def find(self, goal: Any, key: Callable[[T], Any] = _identity) -> T | None:
+        """
+        Find the first item with a specific key
+
+        Unlike SinglyLinkedList.find, the item itself is returned because items do not have a node of their own
+
+        :param goal: The key to search for
+        :param key: The function to extract the key from the data. Default is the identity function
+        :return: T | None - The item with the key or None if not found
+        """
+        current = self.head
+        while current:
+            for data in current.items:
+                if key(data) == goal:
+                    return data
+            current = current.next
+        return None
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Check if the linked list contains a specific item
+        :param item:  The item to search for
+        :return:  bool - True if the item is found, False otherwise
+        """
+        current = self.head
+        while current:
+            if item in current.items:
+                return True
+            current = current.next
+        return False
+
+    def delete(self, goal: Any, key: Callable[[T], Any] = _identity) -> None:
+        """
+        Delete the first item with a specific key
+
+        :param goal:  The key to search for
+        :param key:  The function to extract the key from the data. Default is the identity function
+
+        :raises ValueError: If the linked list is empty
+        :raises KeyError: If the key is not found
+        """
+        if self.is_empty():
+            raise ValueError(_LIST_IS_EMPTY)
+        previous = None
+        current = self.head
+        while current:
+            for index, data in enumerate(current.items):
+                if key(data) == goal:
+                    del current.items[index]
+                    self._size -= 1
+                    self._rebalance(previous, current)
+                    return
+            previous = current
+            current = current.next
+        raise KeyError(_KEY_NOT_FOUND)
+
+    def _rebalance(self, previous: UnrolledNode[T] | None, node: UnrolledNode[T]) -> None:
+        if not node.items:
+            if previous is None:
+                self.head = node.next
+            else:
+                previous.next = node.next
+            if node is self.tail:
+                self.tail = previous
+            return
+        following = node.next
+        if following is None or len(node.items) >= self.capacity // 2:
+            return
+        if len(node.items) + len(following.items) <= self.capacity:
+            node.items.extend(following.items)
+            node.next = following.next
+            if following is self.tail:
+                self.tail = node
+        else:
+            moved = (len(following.items) - len(node.items)) // 2
+            node.items.extend(following.items[:moved])
+            del following.items[:moved]
+
+    def clear(self) -> None:
+        """
+        Clear the linked list
+        """
+        self.head = None
+        self.tail = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield from current.items
+            current = current.next
+
+    def memory_footprint(self) -> MemoryFootprint:
+        """
+        Report the memory used by the linked list, its nodes and its elements. The unused slots of the node arrays
+        are reported as slack
+        :return: MemoryFootprint - The deep size, slack and per-element overhead
+        """
+        structure = shallow_size(self)
+        slack = 0
+        current = self.head
+        while current:
+            structure += sys.getsizeof(current) + sys.getsizeof(current.items)
+            slack += list_capacity(current.items) - len(current.items)
+            current = current.next
+        return footprint(structure, self, slack)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+    def __repr__(self) -> str:
+        return f"UnrolledLinkedList([{', '.join(repr(data) for data in self)}])"
+
+    def __str__(self) -> str:
+        return " -> ".join(str(data) for data in self)
@@ -0,0 +1,146 @@
+import struct
+import sys
+import types
+from collections.abc import Iterable
+
+
+POINTER_SIZE = struct.calcsize("P")
+
+
+class MemoryFootprint:
+    """
+    Memory used by a data structure
+
+    Attributes:
+    total_bytes: int
+        Deep size: the container, its internal arrays and nodes, and the elements
+    element_bytes: int
+        Deep size of the stored elements. An object reachable from several elements is counted once
+    elements: int
+        The number of stored elements
+    slack_slots: int
+        Allocated array slots that hold no element
+    slack_bytes: int
+        The memory taken by the slack slots
+    """
+    __slots__ = ("total_bytes", "element_bytes", "elements", "slack_slots", "slack_bytes")
+
+    def __init__(self, total_bytes: int, element_bytes: int, elements: int, slack_slots: int = 0,
+                 slack_bytes: int = 0):
+        self.total_bytes: int = total_bytes
+        self.element_bytes: int = element_bytes
+        self.elements: int = elements
+        self.slack_slots: int = slack_slots
+        self.slack_bytes: int = slack_bytes
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MemoryFootprint):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in MemoryFootprint.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in MemoryFootprint.__slots__)
+        return f"MemoryFootprint({fields})"
+
+    @property
+    def overhead_bytes(self) -> int:
+        """
+        Bytes used by the structure itself rather than by the elements
+        """
+        return self.total_bytes - self.element_bytes
+
+    @property
+    def per_element_overhead(self) -> float:
+        if self.elements == 0:
+            return float(self.overhead_bytes)
+        return self.overhead_bytes / self.elements
+
+
+def shallow_size(obj: object) -> int:
+    """
+    Size of an object without the objects it refers to, including its instance dictionary if it has one
+    """
+    size = object.__sizeof__(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(vars(obj))
+    return size
+
+
+# Shared by the whole program rather than owned by an element, so they are not measured
+_NOT_MEASURED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def _is_shared(obj: object) -> bool:
+    # None, the booleans and the small ints are single objects cached by the interpreter
+    return obj is None or type(obj) is bool or (type(obj) is int and -5 <= obj <= 256)
+
+
+def deep_size(obj: object, seen: set[int]) -> int:
+    """
+    Size of an object and of every object reachable from it through containers, instance dictionaries and slots,
+    skipping the objects whose id is in seen. The ids of the measured objects are added to seen. A data structure
+    whose __sizeof__ already returns its deep size is measured without its __sizeof__, so the objects it refers to
+    are only counted once, when they are reached
+
+    :param obj: object - The object to measure
+    :param seen: set[int] - The ids of the objects already measured
+    """
+    size = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _NOT_MEASURED) or _is_shared(current):
+            continue
+        seen.add(id(current))
+        if isinstance(type(current).__sizeof__, types.FunctionType):
+            size += object.__sizeof__(current)
+        else:
+            size += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, int, float, complex, bool)):
+            continue
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        if hasattr(current, "__dict__") and id(vars(current)) not in seen:
+            # The keys are attribute names, interned and shared with the class, so only the values are measured
+            attributes = vars(current)
+            seen.add(id(attributes))
+            size += sys.getsizeof(attributes)
+            pending.extend(attributes.values())
+        for cls in type(current).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot not in ("__dict__", "__weakref__") and hasattr(current, slot):
+                    pending.append(getattr(current, slot))
+    return size
+
+
+def list_capacity(items: list) -> int:
+    """
+    Number of slots allocated by a list, which grows in steps and can be larger than its length
+    """
+    return (sys.getsizeof(items) - sys.getsizeof([])) // POINTER_SIZE
+
+
+def footprint(structure_bytes: int, elements: Iterable, slack_slots: int = 0,
+              per_element_bytes: int = 0) -> MemoryFootprint:
+    """
+    Builds a MemoryFootprint from the bytes used by the structure and the stored elements
+
+    :param structure_bytes: int - The bytes of the container and its arrays
+    :param elements: Iterable - The stored elements
+    :param slack_slots: int - The allocated slots that hold no element
+    :param per_element_bytes: int - The structure bytes added by each element, like the node that holds it
+    """
+    element_bytes = 0
+    count = 0
+    seen: set[int] = set()
+    for element in elements:
+        element_bytes += deep_size(element, seen)
+        count += 1
+    total_bytes = structure_bytes + count * per_element_bytes + element_bytes
+    return MemoryFootprint(total_bytes, element_bytes, count, slack_slots,
+                           slack_slots * POINTER_SIZE)
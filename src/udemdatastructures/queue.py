@@ -1,3 +1,8 @@
+import sys
+
+from .memory import MemoryFootprint, footprint, shallow_size
+
+
 class ArrayQueue[T]:
     DEFAULT_CAPACITY = 10
 
@@ -33,6 +38,18 @@ class ArrayQueue[T]:
             raise ValueError('Queue is empty')
         return self._data[self._front]
 
+    def _items(self):
+        capacity = len(self._data)
+        for k in range(self._size):
+            yield self._data[(self._front + k) % capacity]
+
+    def memory_footprint(self) -> MemoryFootprint:
+        slack = len(self._data) - self._size
+        return footprint(shallow_size(self) + sys.getsizeof(self._data), self._items(), slack)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
     def _resize(self, capacity: int):
         old = self._data
         self._data = [None] * capacity
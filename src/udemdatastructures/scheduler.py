@@ -0,0 +1,81 @@
+from typing import Any
+
+from .linked_lists import CircularLinkedList
+
+
+class _Member[T]:
+    __slots__ = ("member", "weight")
+
+    def __init__(self, member: T, weight: int):
+        self.member: T = member
+        self.weight: int = weight
+
+
+class WeightedRoundRobin[T]:
+    """
+    Weighted round-robin scheduler
+
+    The members sit in a CircularLinkedList used as a cursor, and each member gets up to its weight consecutive
+    turns before the cursor moves on. Picking the next member and removing the member at the cursor are O(1).
+    """
+    def __init__(self):
+        self._ring: CircularLinkedList[_Member[T]] = CircularLinkedList()
+        self._turns_left: int = 0  # Turns the member at the cursor still has in this round
+        self._size: int = 0
+
+    def add(self, member: T, weight: int = 1) -> None:
+        """
+        Add a member at the end of the round
+
+        :param member: T - The member to schedule
+        :param weight: int - The number of consecutive turns of the member in each round
+        """
+        if weight < 1:
+            raise ValueError("Weight must be positive")
+        self._ring.append(_Member(member, weight))
+        self._size += 1
+
+    def next(self) -> T:
+        """
+        Return the member whose turn it is
+
+        :raises ValueError: If there are no members
+        """
+        if self.is_empty():
+            raise ValueError("Scheduler is empty")
+        entry = self._ring.current()
+        if self._turns_left == 0:
+            self._turns_left = entry.weight
+        self._turns_left -= 1
+        if self._turns_left == 0:
+            self._ring.next()
+        return entry.member
+
+    def remove(self, member: Any) -> None:
+        """
+        Remove a member. O(1) when it is the member at the cursor, O(n) otherwise
+
+        :raises ValueError: If there are no members
+        :raises KeyError: If the member is not scheduled
+        """
+        if self.is_empty():
+            raise ValueError("Scheduler is empty")
+        if self._ring.current().member == member:
+            self._ring.remove_current()
+            self._turns_left = 0
+        else:
+            self._ring.delete(member, key=lambda entry: entry.member)
+        self._size -= 1
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        """
+        Iterate over the members, starting at the cursor
+        """
+        for entry in self._ring:
+            yield entry.member
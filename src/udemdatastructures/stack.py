@@ -1,3 +1,8 @@
+import sys
+
+from .memory import MemoryFootprint, footprint, list_capacity, shallow_size
+
+
 class ArrayStack[T]:
 
     def __init__(self):
@@ -20,4 +25,11 @@ class ArrayStack[T]:
     def pop(self) -> T:
         if self.is_empty():
             raise ValueError('Stack is empty')
-        return self._data.pop()
\ No newline at end of file
+        return self._data.pop()
+
+    def memory_footprint(self) -> MemoryFootprint:
+        slack = list_capacity(self._data) - len(self._data)
+        return footprint(shallow_size(self) + sys.getsizeof(self._data), self._data, slack)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
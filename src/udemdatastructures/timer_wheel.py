@@ -0,0 +1,246 @@
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .queue import ArrayQueue
+
+
+class Timer[T]:
+    """
+    Handle of a scheduled item
+
+    Attributes:
+    item: T
+        The scheduled item
+    deadline: float
+        The clock time at which the item becomes due
+    """
+    __slots__ = ("item", "deadline", "cancelled", "_expires", "_slot", "_level")
+
+    def __init__(self, item: T, deadline: float, expires: int):
+        self.item: T = item
+        self.deadline: float = deadline
+        self.cancelled: bool = False
+        self._expires: int = expires  # Tick at which the timer fires
+        self._slot: set | None = None  # None while the timer waits in the ready queue
+        self._level: int = 0
+
+
+class TimerWheel[T]:
+    """
+    Hierarchical timer wheel
+
+    Time is divided in ticks. Level 0 has one slot per tick, each higher level has slots that span a whole lower
+    wheel, and timers beyond the last level wait in an overflow set. When the clock enters the span of a higher
+    slot, its timers are cascaded to the lower levels, so scheduling and cancelling are O(1) and every timer is
+    moved at most once per level. Timers never fire early: a deadline is rounded up to the next tick.
+
+    Due items are moved to a FIFO ArrayQueue and handed out by poll_expired, drain_to or the blocking get. The
+    wheel is thread safe.
+    """
+    def __init__(self, tick: float = 0.01, wheel_bits: int = 6, levels: int = 4,
+                 clock: Callable[[], float] = time.monotonic):
+        if tick <= 0:
+            raise ValueError("Tick must be positive")
+        if wheel_bits < 1 or levels < 1:
+            raise ValueError("The wheel must have at least one level with two slots")
+        self.tick: float = tick
+        self._clock: Callable[[], float] = clock
+        self._bits: int = wheel_bits
+        self._mask: int = (1 << wheel_bits) - 1
+        self._wheels: list[list[set[Timer[T]]]] = [[set() for _ in range(1 << wheel_bits)] for _ in range(levels)]
+        self._overflow: set[Timer[T]] = set()
+        # Number of timers in each level, the last entry counts the overflow
+        self._counts: list[int] = [0] * (levels + 1)
+        self._ready: ArrayQueue[Timer[T]] = ArrayQueue()
+        self._ready_count: int = 0  # Ready timers that were not cancelled
+        self._current: int = self._to_tick(clock())
+        self._condition = threading.Condition()
+
+    def _to_tick(self, now: float) -> int:
+        return math.floor(now / self.tick)
+
+    def schedule(self, item: T, delay: float) -> Timer[T]:
+        """
+        Schedules item to become due delay clock units from now
+        """
+        return self.schedule_at(item, self._clock() + delay)
+
+    def schedule_at(self, item: T, deadline: float) -> Timer[T]:
+        """
+        Schedules item to become due at the clock time deadline
+        """
+        timer = Timer(item, deadline, math.ceil(deadline / self.tick))
+        with self._condition:
+            self._place(timer)
+            self._condition.notify_all()
+        return timer
+
+    def cancel(self, timer: Timer[T]) -> bool:
+        """
+        Cancels a timer that has not been handed out yet
+
+        :return: bool - True if the timer was cancelled, False if it already fired or was cancelled
+        """
+        with self._condition:
+            if timer.cancelled or (timer._slot is None and timer._level < 0):
+                return False
+            timer.cancelled = True
+            if timer._slot is None:
+                # The timer is already in the ready queue and is skipped when it reaches the front
+                self._ready_count -= 1
+            else:
+                timer._slot.discard(timer)
+                self._counts[timer._level] -= 1
+                timer._slot = None
+            return True
+
+    def _place(self, timer: Timer[T]):
+        expires, current = timer._expires, self._current
+        if expires <= current:
+            timer._slot = None
+            self._ready.enqueue(timer)
+            self._ready_count += 1
+            return
+        for level, wheel in enumerate(self._wheels):
+            # The timer goes to the lowest level whose parent slot also contains the current tick
+            shift = self._bits * (level + 1)
+            if expires >> shift == current >> shift:
+                slot = wheel[(expires >> (self._bits * level)) & self._mask]
+                break
+        else:
+            level, slot = len(self._wheels), self._overflow
+        slot.add(timer)
+        timer._slot = slot
+        timer._level = level
+        self._counts[level] += 1
+
+    def _advance(self, target: int):
+        while self._current < target:
+            lowest = next((level for level, count in enumerate(self._counts) if count), None)
+            if lowest is None:
+                self._current = target
+                return
+            if lowest > 0:
+                # Nothing can happen before the next boundary of the lowest occupied level
+                boundary = ((self._current >> (self._bits * lowest)) + 1) << (self._bits * lowest)
+                self._current = min(target, boundary - 1)
+                if self._current == target:
+                    return
+            self._current += 1
+            self._cascade()
+            slot = self._wheels[0][self._current & self._mask]
+            if slot:
+                self._counts[0] -= len(slot)
+                for timer in slot:
+                    timer._slot = None
+                    self._ready.enqueue(timer)
+                self._ready_count += len(slot)
+                slot.clear()
+
+    def _cascade(self):
+        current = self._current
+        levels = len(self._wheels)
+        if self._counts[levels] and current & ((1 << (self._bits * levels)) - 1) == 0:
+            self._replace(levels, self._overflow)
+        for level in range(levels - 1, 0, -1):
+            if current & ((1 << (self._bits * level)) - 1) == 0:
+                slot = self._wheels[level][(current >> (self._bits * level)) & self._mask]
+                if slot:
+                    self._replace(level, slot)
+
+    def _replace(self, level: int, slot: set[Timer[T]]):
+        timers = list(slot)
+        slot.clear()
+        self._counts[level] -= len(timers)
+        for timer in timers:
+            self._place(timer)
+
+    def _pop_ready(self) -> Timer[T] | None:
+        while not self._ready.is_empty():
+            timer = self._ready.dequeue()
+            if not timer.cancelled:
+                self._ready_count -= 1
+                timer._level = -1  # Handed out, it can no longer be cancelled
+                return timer
+        return None
+
+    def poll_expired(self, now: float | None = None, limit: int | None = None) -> list[T]:
+        """
+        Returns the items that are due at now, in firing order
+
+        :param now: The current clock time. Default is the wheel clock
+        :param limit: The maximum number of items to return. The rest stay due for the next call
+        """
+        with self._condition:
+            self._advance(self._to_tick(self._clock() if now is None else now))
+            items = []
+            while limit is None or len(items) < limit:
+                timer = self._pop_ready()
+                if timer is None:
+                    break
+                items.append(timer.item)
+            return items
+
+    def drain_to(self, queue: Any, now: float | None = None) -> int:
+        """
+        Enqueues the items that are due at now into queue, which can be any of the project's queue classes
+
+        :return: int - The number of items moved
+        """
+        items = self.poll_expired(now)
+        for item in items:
+            queue.enqueue(item)
+        return len(items)
+
+    def next_deadline(self) -> float | None:
+        """
+        Returns the clock time of the next tick at which a timer fires, or None if nothing is scheduled
+        """
+        with self._condition:
+            return self._next_deadline()
+
+    def _next_deadline(self) -> float | None:
+        if self._ready_count:
+            return self._current * self.tick
+        for level, wheel in enumerate(self._wheels):
+            if not self._counts[level]:
+                continue
+            # Lower levels always fire before higher ones, and within a level the slots after the current one
+            # are in time order
+            first = ((self._current >> (self._bits * level)) & self._mask) + 1
+            for index in range(first, self._mask + 1):
+                if wheel[index]:
+                    return min(timer._expires for timer in wheel[index]) * self.tick
+        if self._overflow:
+            return min(timer._expires for timer in self._overflow) * self.tick
+        return None
+
+    def get(self, timeout: float | None = None) -> T:
+        """
+        Returns the next due item, sleeping until its deadline if needed
+
+        :param timeout: The maximum time to wait. Default is to wait forever
+        :raises TimeoutError: If no item became due within timeout
+        """
+        end = None if timeout is None else self._clock() + timeout
+        with self._condition:
+            while True:
+                now = self._clock()
+                self._advance(self._to_tick(now))
+                timer = self._pop_ready()
+                if timer is not None:
+                    return timer.item
+                if end is not None and now >= end:
+                    raise TimeoutError("No item became due")
+                waits = [deadline - now for deadline in (self._next_deadline(), end) if deadline is not None]
+                # schedule wakes the waiter up, so an earlier timer scheduled meanwhile is not missed
+                self._condition.wait(max(0.0, min(waits)) if waits else None)
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def __len__(self) -> int:
+        return sum(self._counts) + self._ready_count
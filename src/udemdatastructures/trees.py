@@ -1,7 +1,13 @@
+import sys
 from typing import Any
 
+from .memory import MemoryFootprint, footprint, shallow_size
+from .stack import ArrayStack
+
 
 class Node[T]:
+    __slots__ = ("data", "left", "right")
+
     def __init__(self, data: T):
         self.data: T = data
         self.left: Node | None = None
@@ -102,6 +108,14 @@ class BinarySearchTree[T]:
         right_height = self._height(node.right)
         return 1 + max(left_height, right_height)
 
+    def memory_footprint(self) -> MemoryFootprint:
+        # Every node has the same size because its attributes are slots
+        node_size = sys.getsizeof(self.root) if self.root else 0
+        return footprint(shallow_size(self), _inorder(self.root), per_element_bytes=node_size)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
     def __str__(self) -> str:
         """
         Returns a string representation of the tree that can be printed to console as a hierarchy horizontally
@@ -117,4 +131,187 @@ class BinarySearchTree[T]:
         result += self._print(node.right, level + 1)
         result += "\n" + "    " * level + str(node.data)
         result += self._print(node.left, level + 1)
-        return result
\ No newline at end of file
+        return result
+
+
+def _inorder(node: Node | None):
+    """
+    Yields the data of the subtree rooted at node in order, without recursion
+    """
+    stack = ArrayStack[Node]()
+    while node is not None or not stack.is_empty():
+        while node is not None:
+            stack.push(node)
+            node = node.left
+        node = stack.pop()
+        yield node.data
+        node = node.right
+
+
+class TreeSnapshot[T]:
+    """
+    Immutable version of a PersistentBinarySearchTree
+
+    A snapshot shares its nodes with the tree it was taken from. Nodes reachable from a published snapshot are
+    never modified, so any number of readers can search or iterate a snapshot without locks while the writer keeps
+    producing new versions.
+
+    Attributes:
+    root: Node[T] | None
+        The root of this version of the tree
+    key: Callable[[Any], Any]
+        The function to extract the key from the data
+    """
+    def __init__(self, root: Node[T] | None, size: int, key=lambda x: x):
+        self.root: Node[T] | None = root
+        self.key = key
+        self._size: int = size
+
+    def search(self, goal: Any) -> bool:
+        goal_key = self.key(goal)
+        node = self.root
+        while node is not None:
+            node_key = self.key(node.data)
+            if node_key == goal_key:
+                return True
+            node = node.left if goal_key < node_key else node.right
+        return False
+
+    def is_empty(self) -> bool:
+        return self.root is None
+
+    def __contains__(self, goal: Any) -> bool:
+        return self.search(goal)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        """
+        In-order traversal of this version of the tree
+        """
+        return _inorder(self.root)
+
+    def memory_footprint(self) -> MemoryFootprint:
+        """
+        Memory used by this version. Nodes shared with other versions are counted in each of them
+        """
+        node_size = sys.getsizeof(self.root) if self.root else 0
+        return footprint(shallow_size(self), self, per_element_bytes=node_size)
+
+    def __sizeof__(self) -> int:
+        return self.memory_footprint().total_bytes
+
+
+class PersistentBinarySearchTree[T]:
+    """
+    Persistent (path-copying) binary search tree
+
+    Every insert or delete copies only the nodes on the path from the root to the change and shares every other
+    subtree with the previous version. The current version is published with a single reference assignment, so
+    snapshot() is O(1) and a single writer can keep modifying the tree while readers work on their snapshots.
+    Each update allocates O(height) new nodes.
+    """
+    def __init__(self, key=lambda x: x):
+        self.key = key
+        self._version: TreeSnapshot[T] = TreeSnapshot(None, 0, key)
+
+    @property
+    def root(self) -> Node[T] | None:
+        return self._version.root
+
+    def snapshot(self) -> TreeSnapshot[T]:
+        """
+        Returns the current version of the tree. Later updates do not affect the returned snapshot
+        """
+        return self._version
+
+    def insert(self, data: T):
+        version = self._version
+        data_key = self.key(data)
+        path = ArrayStack[tuple[Node, bool]]()
+        node = version.root
+        while node is not None:
+            went_left = data_key < self.key(node.data)
+            path.push((node, went_left))
+            node = node.left if went_left else node.right
+        root = self._rebuild(path, Node(data))
+        self._version = TreeSnapshot(root, len(version) + 1, self.key)
+
+    def delete(self, goal: Any):
+        """
+        Deletes the first node whose key matches the key of goal. Does nothing if there is no such node
+        """
+        version = self._version
+        goal_key = self.key(goal)
+        path = ArrayStack[tuple[Node, bool]]()
+        node = version.root
+        while node is not None:
+            node_key = self.key(node.data)
+            if goal_key < node_key:
+                path.push((node, True))
+                node = node.left
+            elif goal_key > node_key:
+                path.push((node, False))
+                node = node.right
+            else:
+                break
+        if node is None:
+            return
+
+        if node.left is None:
+            replacement = node.right
+        elif node.right is None:
+            replacement = node.left
+        else:
+            # If the node has two children, it is replaced by a copy holding the minimum value of the right subtree
+            min_path = ArrayStack[tuple[Node, bool]]()
+            minimum = node.right
+            while minimum.left is not None:
+                min_path.push((minimum, True))
+                minimum = minimum.left
+            replacement = Node(minimum.data)
+            replacement.left = node.left
+            replacement.right = self._rebuild(min_path, minimum.right)
+        root = self._rebuild(path, replacement)
+        self._version = TreeSnapshot(root, len(version) - 1, self.key)
+
+    def _rebuild(self, path: ArrayStack[tuple[Node, bool]], child: Node | None) -> Node | None:
+        """
+        Copies the nodes of a root-to-leaf path bottom-up, linking each copy to the new child on the side the path
+        went and sharing the subtree on the other side
+
+        :return: Node | None - The copy of the first node of the path, or child if the path is empty
+        """
+        while not path.is_empty():
+            node, went_left = path.pop()
+            child = self._copy(node, left=child) if went_left else self._copy(node, right=child)
+        return child
+
+    @staticmethod
+    def _copy(node: Node, **children: Node | None) -> Node:
+        new_node = Node(node.data)
+        new_node.left = children.get("left", node.left)
+        new_node.right = children.get("right", node.right)
+        return new_node
+
+    def search(self, goal: Any) -> bool:
+        return self._version.search(goal)
+
+    def is_empty(self) -> bool:
+        return self._version.is_empty()
+
+    def __contains__(self, goal: Any) -> bool:
+        return self._version.search(goal)
+
+    def __len__(self) -> int:
+        return len(self._version)
+
+    def __iter__(self):
+        return iter(self._version)
+
+    def memory_footprint(self) -> MemoryFootprint:
+        return self._version.memory_footprint()
+
+    def __sizeof__(self) -> int:
+        return self._version.memory_footprint().total_bytes